@@ -8,16 +8,33 @@ Data source: https://livingwage.mit.edu
 Usage is within their stated 10-location fair-use policy.
 """
 
+from __future__ import annotations
+
 import argparse
+import difflib
+import functools
+import hashlib
+import importlib.util
 import json
 import math
 import os
 import re
 import sys
-from typing import Optional
-
-import requests
-from bs4 import BeautifulSoup
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
+
+# requests and bs4 account for most of this module's import time, so they
+# are imported on the fetch path only; --list and --help never load them
+if TYPE_CHECKING:
+    import requests
+    from bs4 import BeautifulSoup
+    from urllib3.util.retry import Retry
+
+# Prefer the C-based lxml parser; fall back to the stdlib parser if missing
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
 
 # Default database path (relative to this script)
 DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "database", "locations_v1.json")
@@ -27,10 +44,14 @@ METROS: dict[str, str] = {}
 COUNTIES: dict[str, str] = {}
 STATES: dict[str, str] = {}
 
+# Flat search index of (type, code, name, lowercased name), rebuilt by
+# load_database() so searches don't re-lowercase every name per query
+_SEARCH_INDEX: list[tuple[str, str, str, str]] = []
+
 
 def load_database(path: str = DEFAULT_DB_PATH) -> None:
     """Load location database from a JSON file into module globals."""
-    global METROS, COUNTIES, STATES
+    global METROS, COUNTIES, STATES, _SEARCH_INDEX
     try:
         with open(path) as f:
             data = json.load(f)
@@ -43,6 +64,11 @@ def load_database(path: str = DEFAULT_DB_PATH) -> None:
     METROS = data.get("metros", {})
     COUNTIES = data.get("counties", {})
     STATES = data.get("states", {})
+    _SEARCH_INDEX = [
+        (typ, code, name, name.lower())
+        for typ, locations in (("metro", METROS), ("county", COUNTIES), ("state", STATES))
+        for code, name in locations.items()
+    ]
 
 # Family configuration labels: key -> (display name, column index in tables)
 FAMILY_KEYS = [
@@ -85,57 +111,91 @@ ANNUAL_ROW_LABELS = EXPENSE_CATEGORIES + [
     "Required annual income after taxes",
 ]
 
+# Case-insensitive lookup for --exclude names
+_CATEGORY_LOOKUP = {cat.casefold(): cat for cat in EXPENSE_CATEGORIES}
+_CATEGORY_NAMES = ", ".join(EXPENSE_CATEGORIES)
+
+# Substrings that identify each ANNUAL_ROW_LABELS row in MIT's expense table
+ROW_LABEL_ALIASES: dict[str, tuple[str, ...]] = {
+    "Food": ("food",),
+    "Child Care": ("child care", "childcare"),
+    "Medical": ("medical",),
+    "Housing": ("housing",),
+    "Transportation": ("transportation",),
+    "Civic": ("civic",),
+    "Internet & Mobile": ("internet & mobile", "broadband", "internet", "telephone"),
+    "Other": ("other necessities", "other"),
+    "Required annual income before taxes": (
+        "required annual income before taxes",
+        "annual income before taxes",
+        "income before taxes",
+    ),
+    "Annual taxes": ("annual taxes", "taxes"),
+    "Required annual income after taxes": (
+        "required annual income after taxes",
+        "annual income after taxes",
+        "income after taxes",
+    ),
+}
+
+# Flattened (alias, target) pairs, longest alias first so the most specific
+# match wins (e.g. "income after taxes" before the bare "taxes")
+_ROW_LABEL_PATTERNS: list[tuple[str, str]] = sorted(
+    ((alias, target) for target, aliases in ROW_LABEL_ALIASES.items() for alias in aliases),
+    key=lambda pair: -len(pair[0]),
+)
+
+# Location name as it appears in page headings and the <title>
+_NAME_PREFIX_RE = re.compile(r"Living Wage Calcula(?:tion|tor) for (.+)$", re.S)
+# Looser fallback for titles that don't use the standard prefix
+_TITLE_FOR_RE = re.compile(r"for\s+(.+)$")
+
+# Separators between the place names in e.g. "Cook County (Chicago), IL"
+_NAME_PART_SPLIT_RE = re.compile(r"[-,()/]")
+
+LOCATION_TYPE_FLAGS = {"metro": "--metros", "county": "--counties", "state": "--states"}
+
 
 # ---------------------------------------------------------------------------
 # Search / lookup helpers
 # ---------------------------------------------------------------------------
 
-def search_locations(query: str) -> list[tuple[str, str, str]]:
-    """Fuzzy-search metros, counties, and states. Returns list of (type, code, name)."""
-    q = query.lower()
-    results: list[tuple[str, str, str]] = []
+def _match_index(query_lower: str) -> list[tuple[str, str, str, str]]:
+    """Return _SEARCH_INDEX entries whose lowercased name contains the query."""
+    return [entry for entry in _SEARCH_INDEX if query_lower in entry[3]]
 
-    for code, name in METROS.items():
-        if q in name.lower():
-            results.append(("metro", code, name))
-    for code, name in COUNTIES.items():
-        if q in name.lower():
-            results.append(("county", code, name))
-    for code, name in STATES.items():
-        if q in name.lower():
-            results.append(("state", code, name))
 
-    return results
+def search_locations(query: str) -> list[tuple[str, str, str]]:
+    """Fuzzy-search metros, counties, and states. Returns list of (type, code, name)."""
+    return [entry[:3] for entry in _match_index(query.lower())]
 
 
 def resolve_search_term(term: str) -> tuple[str, str, str]:
     """Resolve a search term to (type, code, name). Exits on ambiguity."""
-    matches = search_locations(term)
+    # Work on full index entries so narrowing can reuse the cached
+    # lowercase names instead of re-lowercasing each candidate
+    tl = term.lower()
+    entries = _match_index(tl)
+    matches = [entry[:3] for entry in entries]
     if not matches:
         print(f"Error: No location found matching '{term}'.")
+        suggestions = _suggest_locations(term)
+        if suggestions:
+            print("Did you mean:")
+            for typ, code, name in suggestions:
+                print(f"    {LOCATION_TYPE_FLAGS[typ]} {code}  {name}")
         print("Use --list to see available locations, or provide codes directly.")
         sys.exit(1)
     if len(matches) == 1:
         return matches[0]
 
-    # Check which location types matched
-    types_found = set(m[0] for m in matches)
-
-    # If only one type matched, apply within-type disambiguation
-    if len(types_found) == 1:
-        typ = types_found.pop()
-        # For a single type with one result, return it
-        if len(matches) == 1:
-            return matches[0]
-        # Prefer match whose name starts with the query
-        starting = [m for m in matches if m[2].lower().startswith(term.lower())]
-        if len(starting) == 1:
-            return starting[0]
-
-    # Multiple types matched — if only one metro, prefer it (most common use case)
-    metro_matches = [m for m in matches if m[0] == "metro"]
-    county_matches = [m for m in matches if m[0] == "county"]
-    state_matches = [m for m in matches if m[0] == "state"]
+    # Partition matches by type in a single pass
+    by_type: dict[str, list[tuple[str, str, str, str]]] = {"metro": [], "county": [], "state": []}
+    for entry in entries:
+        by_type[entry[0]].append(entry)
+    metro_matches = by_type["metro"]
+    county_matches = by_type["county"]
+    state_matches = by_type["state"]
 
     # If there are both metros and counties (and/or states), always disambiguate
     # so the user can pick the right granularity
@@ -143,162 +203,362 @@ def resolve_search_term(term: str) -> tuple[str, str, str]:
         _print_disambiguation(term, matches)
         sys.exit(1)
 
-    # Only metros matched (multiple) — try narrowing
-    if metro_matches and not county_matches:
-        if len(metro_matches) == 1:
-            return metro_matches[0]
-        starting = [m for m in metro_matches if m[2].lower().startswith(term.lower())]
-        if len(starting) == 1:
-            return starting[0]
-
-    # Only counties matched (multiple) — try narrowing
-    if county_matches and not metro_matches:
-        if len(county_matches) == 1:
-            return county_matches[0]
-        starting = [m for m in county_matches if m[2].lower().startswith(term.lower())]
-        if len(starting) == 1:
-            return starting[0]
+    # Narrow within the finest granularity that matched: a lone metro or
+    # county wins outright (most common use case), otherwise prefer a
+    # unique name that starts with the query
+    candidates = metro_matches or county_matches
+    if len(candidates) == 1:
+        return candidates[0][:3]
+    starting = [e for e in candidates or state_matches if e[3].startswith(tl)]
+    if len(starting) == 1:
+        return starting[0][:3]
 
     # If no metro or county match, prefer exact state name match
-    if not metro_matches and not county_matches:
-        for m in state_matches:
-            if m[2].lower() == term.lower():
-                return m
+    if not candidates:
+        for entry in state_matches:
+            if entry[3] == tl:
+                return entry[:3]
 
     _print_disambiguation(term, matches)
     sys.exit(1)
 
 
+def _suggest_locations(term: str, limit: int = 5) -> list[tuple[str, str, str]]:
+    """Suggest locations whose name, or one place within it, is close to term.
+
+    Used only when a search has no substring match, to catch typos like
+    "Atlnta". Returns up to `limit` (type, code, name) tuples.
+    """
+    by_part: dict[str, list[tuple[str, str, str]]] = {}
+    for typ, code, name, name_lower in _SEARCH_INDEX:
+        for part in {name_lower, *_NAME_PART_SPLIT_RE.split(name_lower)}:
+            part = part.strip()
+            if part:
+                by_part.setdefault(part, []).append((typ, code, name))
+
+    suggestions: list[tuple[str, str, str]] = []
+    for part in difflib.get_close_matches(term.lower().strip(), by_part, n=limit, cutoff=0.75):
+        for match in by_part[part]:
+            if match not in suggestions:
+                suggestions.append(match)
+    return suggestions[:limit]
+
+
 def _print_disambiguation(term: str, matches: list[tuple[str, str, str]]) -> None:
     """Print disambiguation list grouped by type."""
     type_order = ["metro", "county", "state"]
     type_labels = {"metro": "Metro Areas", "county": "Counties", "state": "States"}
-    type_flags = {"metro": "--metros", "county": "--counties", "state": "--states"}
 
     print(f"Multiple locations match '{term}':")
     for typ in type_order:
         group = [m for m in matches if m[0] == typ]
         if group:
             print(f"\n  {type_labels[typ]}:")
-            flag = type_flags[typ]
+            flag = LOCATION_TYPE_FLAGS[typ]
             for _, code, name in group:
                 print(f"    {flag} {code}  {name}")
     print(f"\nTip: use --metros, --counties, or --states with the codes above.")
 
 
+# MIT Living Wage Calculator URL prefix for each location type
+LOCATION_URL_PREFIXES = {
+    "metro": "https://livingwage.mit.edu/metros/",
+    "county": "https://livingwage.mit.edu/counties/",
+    "state": "https://livingwage.mit.edu/states/",
+}
+
+
 def location_url(loc_type: str, code: str) -> str:
     """Build MIT Living Wage Calculator URL."""
-    base = "https://livingwage.mit.edu"
-    if loc_type == "metro":
-        return f"{base}/metros/{code}"
-    elif loc_type == "county":
-        return f"{base}/counties/{code}"
-    elif loc_type == "state":
-        return f"{base}/states/{code}"
-    else:
+    prefix = LOCATION_URL_PREFIXES.get(loc_type)
+    if prefix is None:
         print(f"Error: Unknown location type '{loc_type}'.")
         sys.exit(1)
+    return prefix + code
 
 
 # ---------------------------------------------------------------------------
 # Scraping / parsing
 # ---------------------------------------------------------------------------
 
-def fetch_page(url: str) -> BeautifulSoup:
-    """Fetch a page and return parsed HTML."""
-    headers = {
-        "User-Agent": (
-            "COL-Compare-Tool/1.0 (cost-of-living research; "
-            "respects 10-location fair-use policy)"
-        ),
-    }
-    resp = requests.get(url, headers=headers, timeout=30)
-    resp.raise_for_status()
-    return BeautifulSoup(resp.text, "html.parser")
+# Never have more requests in flight than MIT's 10-location fair-use policy
+MAX_CONCURRENT_FETCHES = 10
 
+USER_AGENT = (
+    "COL-Compare-Tool/1.0 (cost-of-living research; "
+    "respects 10-location fair-use policy)"
+)
 
-def parse_dollar(text: str) -> Optional[float]:
-    """Parse a dollar string like '$1,234' or '$1,234.56' to float."""
-    text = text.strip().replace(",", "").replace("$", "").replace("−", "-").replace("–", "-")
-    if not text or text == "-":
+# Shared session so repeated fetches reuse the keep-alive connection to
+# livingwage.mit.edu instead of paying a TCP+TLS handshake per location.
+# Created on first use by _get_session().
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+# Longest Retry-After we will honour; urllib3 would otherwise wait up to
+# 6 hours per attempt on a 429/503
+RETRY_AFTER_MAX_SECONDS = 30
+
+
+def _retry_policy() -> Retry:
+    """Build the retry policy for the shared session.
+
+    Each retry is reported on stderr with its reason and wait, so a slow
+    run doesn't look like a hang.
+    """
+    from urllib3.util.retry import Retry
+
+    class ReportingRetry(Retry):
+        # Scheme and host of the pool being retried; history entries only
+        # record the request path
+        origin = ""
+
+        def increment(self, method=None, url=None, response=None, error=None,
+                      _pool=None, _stacktrace=None):
+            new_retry = super().increment(method, url, response, error, _pool, _stacktrace)
+            if _pool is not None:
+                default_port = {"http": 80, "https": 443}.get(_pool.scheme)
+                port = "" if _pool.port in (None, default_port) else f":{_pool.port}"
+                new_retry.origin = f"{_pool.scheme}://{_pool.host}{port}"
+            return new_retry
+
+        def sleep(self, response=None) -> None:
+            wait = None
+            if self.respect_retry_after_header and response is not None:
+                wait = self.get_retry_after(response)
+            if not wait:
+                wait = self.get_backoff_time()
+            last = self.history[-1]
+            # Requests through a proxy already use the absolute URL
+            url = last.url if "://" in (last.url or "") else self.origin + (last.url or "")
+            reason = f"HTTP {last.status}" if last.status else type(last.error).__name__
+            _progress(f"Retrying {url} in {wait:.1f}s ({reason}) ...")
+            if wait > 0:
+                time.sleep(wait)
+
+    return ReportingRetry(
+        total=3,
+        connect=3,
+        read=2,
+        backoff_factor=0.5,
+        # Spread retries from concurrent fetches so they don't arrive together
+        backoff_jitter=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=True,
+        retry_after_max=RETRY_AFTER_MAX_SECONDS,
+        # Hand the final error response back so raise_for_status()
+        # reports it as a normal HTTPError
+        raise_on_status=False,
+    )
+
+
+def _get_session() -> requests.Session:
+    """Return the shared HTTP session, creating it on first use."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=10,
+                # Retry transient failures on the pooled connection instead of
+                # aborting a run that may already have fetched other locations
+                max_retries=_retry_policy(),
+            )
+            session = requests.Session()
+            session.headers.update({"User-Agent": USER_AGENT})
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSION = session
+    return _SESSION
+
+
+# On-disk cache of fetched pages and their parsed data; MIT's data changes
+# rarely, so repeat runs within a day are served locally instead of
+# re-downloading and re-parsing
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "col-compare",
+)
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Cache file suffixes. Bump the parsed-data version whenever the shape or
+# meaning of parse_location_data()'s output changes, so stale entries are
+# ignored rather than misread.
+_PAGE_CACHE_SUFFIX = ".html"
+_DATA_CACHE_SUFFIX = ".v2.json"
+
+
+def _cache_path(url: str, suffix: str) -> str:
+    """Path of the cache file for a URL."""
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + suffix)
+
+
+def _read_cache(url: str, suffix: str) -> Optional[bytes]:
+    """Return the cached bytes for a URL, or None if missing or expired."""
+    path = _cache_path(url, suffix)
+    try:
+        if time.time() - os.path.getmtime(path) > CACHE_TTL_SECONDS:
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
         return None
+
+
+def _write_cache(url: str, suffix: str, content: bytes) -> None:
+    """Store bytes in the cache. Failures are ignored; caching is best-effort."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write to a temp file and rename so concurrent fetches never see partial files
+        f = tempfile.NamedTemporaryFile(dir=CACHE_DIR, delete=False)
+    except OSError:
+        return
     try:
-        return float(text)
+        with f:
+            f.write(content)
+        os.replace(f.name, _cache_path(url, suffix))
+    except OSError:
+        # Don't leave the partial temp file behind; nothing expires it
+        try:
+            os.unlink(f.name)
+        except OSError:
+            pass
+
+
+def _progress(message: str) -> None:
+    """Report fetch progress on stderr.
+
+    Uses a single write so lines from concurrent fetch threads don't interleave.
+    """
+    sys.stderr.write(message + "\n")
+
+
+class FetchError(Exception):
+    """A page could not be downloaded; wraps the underlying requests error."""
+
+    def __init__(self, url: str, error: Exception) -> None:
+        super().__init__(f"{url}: {error}")
+        self.url = url
+        self.error = error
+
+
+def fetch_page(url: str) -> bytes:
+    """Download a page and return its raw bytes. Progress is reported on stderr.
+
+    Raises FetchError for HTTP and connection errors.
+    """
+    import requests
+
+    _progress(f"Fetching data from {url} ...")
+    try:
+        resp = _get_session().get(url, timeout=30)
+        resp.raise_for_status()
+        return resp.content
+    except (requests.HTTPError, requests.ConnectionError) as e:
+        # Errors raised while reading the body carry no request, so name
+        # the page here rather than relying on e.request
+        raise FetchError(url, e) from e
+
+
+# parse_location_data only reads the title, h2/h3 headings and tables, so
+# the rest of the page (navigation, scripts, prose) is never built into a tree
+PAGE_TAGS = ["title", "h2", "h3", "table"]
+
+
+def parse_page(content: bytes) -> BeautifulSoup:
+    """Parse a Living Wage Calculator page, keeping only the elements we read."""
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    return BeautifulSoup(content, HTML_PARSER, parse_only=SoupStrainer(PAGE_TAGS))
+
+
+# Drop currency symbols, thousands separators and (non-breaking) spaces,
+# and normalize minus and en dashes to an ASCII hyphen, in one pass
+_DOLLAR_TRANS = str.maketrans(
+    {",": None, "$": None, " ": None, "\xa0": None, "\u2212": "-", "\u2013": "-"}
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_dollar(text: str) -> Optional[float]:
+    """Parse a dollar string like '$1,234' or '$1,234.56' to float.
+
+    Memoized: expense tables repeat many cell values ($0, shared
+    per-family amounts) across rows and locations.
+    """
+    try:
+        return float(text.translate(_DOLLAR_TRANS))
     except ValueError:
         return None
 
 
-def parse_wage(text: str) -> Optional[float]:
-    """Parse a wage string like '$28.89' to float."""
-    return parse_dollar(text)
+# Wages use the same format, e.g. '$28.89'
+parse_wage = parse_dollar
 
 
-def _extract_table_rows(soup: BeautifulSoup, table_id: str) -> list[list[str]]:
-    """Extract rows from a table by its id. Returns list of [label, val1, val2, ...]."""
-    table = soup.find("table", id=table_id)
-    if not table:
-        return []
-    rows = []
+def _iter_table_rows(table) -> Iterator[list[str]]:
+    """Yield the text cells of each non-empty row of a BeautifulSoup table."""
     for tr in table.find_all("tr"):
-        cells = tr.find_all(["td", "th"])
+        # Cells are direct children of their row; don't search the whole subtree
+        cells = tr.find_all(["td", "th"], recursive=False)
         if cells:
-            rows.append([c.get_text(strip=True) for c in cells])
-    return rows
+            yield [c.get_text(strip=True) for c in cells]
 
 
-def _find_table_by_heading(soup: BeautifulSoup, heading_text: str) -> Optional[BeautifulSoup]:
-    """Find a table that follows a heading containing the given text."""
-    for heading in soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6", "p", "div"]):
-        if heading_text.lower() in heading.get_text(strip=True).lower():
-            table = heading.find_next("table")
-            if table:
-                return table
-    return None
+def _parse_family_values(
+    values: list[str], parse: Callable[[str], Optional[float]] = parse_dollar
+) -> dict[str, float]:
+    """Parse a row of dollar cells into a dict keyed by FAMILY_KEYS.
 
+    Cells beyond the known family columns are ignored and cells that
+    don't parse are omitted.
+    """
+    return {
+        key: v
+        for key, v in zip(FAMILY_KEYS, map(parse, values))
+        if v is not None
+    }
 
-def _parse_table_to_rows(table) -> list[list[str]]:
-    """Parse a BeautifulSoup table element into a list of text rows."""
-    rows = []
-    for tr in table.find_all("tr"):
-        cells = tr.find_all(["td", "th"])
-        if cells:
-            rows.append([c.get_text(strip=True) for c in cells])
-    return rows
+
+def _scan_tables(soup: BeautifulSoup) -> tuple[Optional[BeautifulSoup], Optional[BeautifulSoup]]:
+    """Find the hourly wage table and the annual expenses table in one pass.
+
+    Each table's text is materialized once and checked against both
+    classifiers; the scan stops as soon as both tables are found.
+    """
+    wage_table = None
+    expense_table = None
+    for table in soup.find_all("table"):
+        text = table.get_text(strip=True).lower()
+        if wage_table is None and "living wage" in text and (
+            "poverty wage" in text or "minimum wage" in text
+        ):
+            wage_table = table
+        if expense_table is None and (
+            "typical expenses" in text
+            or ("food" in text and "housing" in text and "transportation" in text)
+        ):
+            # Require at least one data row with values beyond the label
+            for tr in table.find_all("tr"):
+                if len(tr.find_all("td")) > 1:
+                    expense_table = table
+                    break
+        if wage_table is not None and expense_table is not None:
+            break
+    return wage_table, expense_table
 
 
-def _match_row_label(row_label: str, target: str) -> bool:
-    """Check if a row label matches a target category, with fuzzy matching."""
+def _classify_row_label(row_label: str) -> Optional[str]:
+    """Map an annual expenses row label to its ANNUAL_ROW_LABELS entry, or None."""
     rl = row_label.lower().strip()
-    tl = target.lower().strip()
-    # Direct containment
-    if tl in rl or rl in tl:
-        return True
-    # Handle some known variations
-    aliases = {
-        "internet & mobile": ["broadband", "internet", "telephone"],
-        "civic": ["civic"],
-        "other": ["other necessities", "other"],
-        "food": ["food"],
-        "child care": ["child care", "childcare"],
-        "medical": ["medical"],
-        "housing": ["housing"],
-        "transportation": ["transportation"],
-        "required annual income before taxes": [
-            "required annual income before taxes",
-            "annual income before taxes",
-            "income before taxes",
-        ],
-        "annual taxes": ["annual taxes", "taxes"],
-        "required annual income after taxes": [
-            "required annual income after taxes",
-            "annual income after taxes",
-            "income after taxes",
-        ],
-    }
-    for key, als in aliases.items():
-        if tl == key:
-            return any(a in rl for a in als)
-    return False
+    for alias, target in _ROW_LABEL_PATTERNS:
+        if alias in rl:
+            return target
+    return None
 
 
 def parse_location_data(soup: BeautifulSoup) -> dict:
@@ -314,120 +574,73 @@ def parse_location_data(soup: BeautifulSoup) -> dict:
     """
     data: dict = {}
 
-    # Extract location name from heading or title
-    # The h1 is the site logo; the location is in an h2 like
+    # Extract location name. The <title> and an h2 both read like
     # "Living Wage Calculation for Atlanta-Sandy Springs-Alpharetta, GA"
+    # (the h1 is the site logo); the title is cheapest to check first.
     name = "Unknown"
-    for heading in soup.find_all(["h2", "h3"]):
-        text = heading.get_text(strip=True)
-        for prefix in [
-            "Living Wage Calculation for ",
-            "Living Wage Calculator for ",
-        ]:
-            if text.startswith(prefix):
-                name = text[len(prefix):]
-                break
-        if name != "Unknown":
-            break
-
-    if name == "Unknown":
-        title = soup.find("title")
-        if title:
-            t = title.get_text(strip=True)
-            m = re.search(r"for\s+(.+)$", t)
+    title = soup.find("title")
+    title_text = title.get_text(strip=True) if title else ""
+    m = _NAME_PREFIX_RE.search(title_text)
+    if m:
+        name = m.group(1)
+    else:
+        # soup.find stops at the first matching heading
+        heading = soup.find(
+            lambda tag: tag.name in ("h2", "h3")
+            and _NAME_PREFIX_RE.match(tag.get_text(strip=True)) is not None
+        )
+        if heading is not None:
+            name = _NAME_PREFIX_RE.match(heading.get_text(strip=True)).group(1)
+        else:
+            m = _TITLE_FOR_RE.search(title_text)
             if m:
                 name = m.group(1).strip()
 
     data["name"] = name
 
-    # --- Parse hourly living wage table ---
-    # Look for table with "Living Wage" as header
-    wage_table = None
-    for table in soup.find_all("table"):
-        text = table.get_text(strip=True).lower()
-        if "living wage" in text and ("poverty wage" in text or "minimum wage" in text):
-            wage_table = table
-            break
+    wage_table, expense_table = _scan_tables(soup)
 
-    wages = {}
+    # --- Parse hourly living wage table ---
+    wages: dict[str, float] = {}
     if wage_table:
-        rows = _parse_table_to_rows(wage_table)
-        for row in rows:
+        for row in _iter_table_rows(wage_table):
             if row and "living wage" in row[0].lower():
-                values = row[1:]  # skip label
-                for i, key in enumerate(FAMILY_KEYS):
-                    if i < len(values):
-                        w = parse_wage(values[i])
-                        if w is not None:
-                            wages[key] = w
+                wages = _parse_family_values(row[1:], parse_wage)  # skip label
                 break
     data["wages"] = wages
 
     # --- Parse annual expenses table ---
-    # Look for the "Typical Expenses" table
-    expense_table = None
-    for table in soup.find_all("table"):
-        table_text = table.get_text(strip=True).lower()
-        if "typical expenses" in table_text or (
-            "food" in table_text and "housing" in table_text and "transportation" in table_text
-        ):
-            # Check it has dollar amounts (to distinguish from the wage table)
-            first_data_row = None
-            for tr in table.find_all("tr"):
-                cells = tr.find_all("td")
-                if cells and len(cells) > 1:
-                    first_data_row = cells
-                    break
-            if first_data_row and "$" in first_data_row[0].get_text():
-                # This is likely the right table, but the label is in the first column
-                pass
-            if first_data_row:
-                expense_table = table
-                break
-
     expenses: dict[str, dict[str, float]] = {}
     income_before_tax: dict[str, float] = {}
     income_after_tax: dict[str, float] = {}
     taxes: dict[str, float] = {}
 
+    # Income/tax rows accumulate into their own dicts; every other
+    # classified row is an expense category
+    summary_rows = {
+        "Required annual income before taxes": income_before_tax,
+        "Annual taxes": taxes,
+        "Required annual income after taxes": income_after_tax,
+    }
+
     if expense_table:
-        rows = _parse_table_to_rows(expense_table)
-        for row in rows:
-            if not row or len(row) < 2:
+        # Stop reading rows once every label we look for has been seen
+        remaining = set(ANNUAL_ROW_LABELS)
+        for row in _iter_table_rows(expense_table):
+            if len(row) < 2:
                 continue
-            label = row[0]
-            values = row[1:]
-
-            # Check each known category
-            for cat in EXPENSE_CATEGORIES:
-                if _match_row_label(label, cat):
-                    expenses[cat] = {}
-                    for i, key in enumerate(FAMILY_KEYS):
-                        if i < len(values):
-                            v = parse_dollar(values[i])
-                            if v is not None:
-                                expenses[cat][key] = v
-                    break
+            target = _classify_row_label(row[0])
+            if target is None:
+                continue
+            row_values = _parse_family_values(row[1:])
+            summary = summary_rows.get(target)
+            if summary is not None:
+                summary.update(row_values)
             else:
-                # Check income/tax rows
-                if _match_row_label(label, "Required annual income before taxes"):
-                    for i, key in enumerate(FAMILY_KEYS):
-                        if i < len(values):
-                            v = parse_dollar(values[i])
-                            if v is not None:
-                                income_before_tax[key] = v
-                elif _match_row_label(label, "Annual taxes"):
-                    for i, key in enumerate(FAMILY_KEYS):
-                        if i < len(values):
-                            v = parse_dollar(values[i])
-                            if v is not None:
-                                taxes[key] = v
-                elif _match_row_label(label, "Required annual income after taxes"):
-                    for i, key in enumerate(FAMILY_KEYS):
-                        if i < len(values):
-                            v = parse_dollar(values[i])
-                            if v is not None:
-                                income_after_tax[key] = v
+                expenses[target] = row_values
+            remaining.discard(target)
+            if not remaining:
+                break
 
     data["expenses"] = expenses
     data["income_before_tax"] = income_before_tax
@@ -437,19 +650,140 @@ def parse_location_data(soup: BeautifulSoup) -> dict:
     return data
 
 
+@functools.lru_cache(maxsize=256)
+def get_location(loc_type: str, code: str, use_cache: bool = True) -> dict:
+    """Fetch and parse one location, memoized for the life of the process.
+
+    The returned dict is shared between callers and must not be mutated.
+    Both the parsed data and the raw page are cached on disk. With
+    use_cache=False the cache is not read, but fresh results are still
+    written so they replace stale entries.
+    """
+    url = location_url(loc_type, code)
+    data = _read_cached_data(url) if use_cache else None
+    if data is not None:
+        _progress(f"Using cached data for {url}")
+    else:
+        content = _read_cache(url, _PAGE_CACHE_SUFFIX) if use_cache else None
+        fetched = content is None
+        if fetched:
+            content = fetch_page(url)
+        else:
+            _progress(f"Using cached data for {url}")
+        data = parse_location_data(parse_page(content))
+        # Keep only pages that parsed to real data, so a maintenance or
+        # error page served with a 200 doesn't stick for the whole TTL
+        if _has_location_data(data):
+            if fetched:
+                _write_cache(url, _PAGE_CACHE_SUFFIX, content)
+            _write_cache(url, _DATA_CACHE_SUFFIX, json.dumps(data).encode())
+    data["url"] = url
+    return data
+
+
+def _has_location_data(data: dict) -> bool:
+    """Whether parsed page data has the income and expense figures we report."""
+    return bool(data.get("income_before_tax")) and bool(data.get("expenses"))
+
+
+def _read_cached_data(url: str) -> Optional[dict]:
+    """Return previously parsed data for a URL from the cache, if fresh and valid."""
+    content = _read_cache(url, _DATA_CACHE_SUFFIX)
+    if content is None:
+        return None
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) and _has_location_data(data) else None
+
+
+def fetch_locations(
+    loc_specs: list[tuple[str, str]], use_cache: bool = True
+) -> list[dict]:
+    """Fetch several (type, code) locations concurrently, in input order.
+
+    Repeated specs are fetched once. Raises the first FetchError
+    encountered, like fetch_page().
+    """
+    unique = list(dict.fromkeys(loc_specs))
+    workers = min(MAX_CONCURRENT_FETCHES, len(unique))
+    if workers <= 1:
+        fetched = [get_location(t, c, use_cache) for t, c in unique]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetched = list(executor.map(lambda spec: get_location(*spec, use_cache), unique))
+    by_spec = dict(zip(unique, fetched))
+    return [by_spec[spec] for spec in loc_specs]
+
+
 # ---------------------------------------------------------------------------
 # Comparison logic
 # ---------------------------------------------------------------------------
 
-def _adjust_living_wage(
-    lw: float, loc: Optional[dict], family: str, excluded: set[str]
+def _split_expenses(
+    loc: Optional[dict], family: str, excluded: set[str]
+) -> tuple[float, float, float]:
+    """Total a location's expenses as (housing, non-housing, excluded).
+
+    Housing and non-housing cover only included categories. All three
+    are zero when no location data is available.
+    """
+    housing = non_housing = excluded_total = 0.0
+    if loc is None:
+        return housing, non_housing, excluded_total
+    expenses = loc.get("expenses", {})
+    for cat in EXPENSE_CATEGORIES:
+        v = expenses.get(cat, {}).get(family, 0.0)
+        if cat in excluded:
+            excluded_total += v
+        elif cat == "Housing":
+            housing = v
+        else:
+            non_housing += v
+    return housing, non_housing, excluded_total
+
+
+def _engel_equivalent(
+    income_a: float,
+    adj_a: float,
+    ratio: float,
+    housing_a: float,
+    housing_b: float,
+    non_housing_a: float,
+    non_housing_b: float,
 ) -> float:
-    """Subtract excluded expense categories from a living-wage total."""
-    if not excluded or loc is None:
-        return lw
-    for cat in excluded:
-        lw -= loc.get("expenses", {}).get(cat, {}).get(family, 0.0)
-    return lw
+    """Engel-curve equivalent income from precomputed expense totals.
+
+    Pure float arithmetic with no dict lookups, so bulk callers can
+    evaluate it over many locations or incomes without re-walking the
+    expense data.
+    """
+    # Compute per-category ratios (guard against zero)
+    housing_ratio = (housing_b / housing_a) if housing_a > 0 else ratio
+    non_housing_ratio = (
+        (non_housing_b / non_housing_a) if non_housing_a > 0 else ratio
+    )
+
+    # Housing share at the living wage level
+    total_expenses_a = housing_a + non_housing_a
+    housing_share_at_lw = (
+        (housing_a / total_expenses_a) if total_expenses_a > 0 else 0.3
+    )
+
+    # Engel curve: housing share decreases with income
+    if adj_a > 0 and income_a > 0:
+        housing_share = housing_share_at_lw * (
+            (adj_a / income_a) ** 0.3
+        )
+    else:
+        housing_share = housing_share_at_lw
+
+    effective_ratio = (
+        housing_share * housing_ratio
+        + (1 - housing_share) * non_housing_ratio
+    )
+    return income_a * effective_ratio
 
 
 def compute_equivalent_income(
@@ -475,9 +809,14 @@ def compute_equivalent_income(
     """
     excluded = excluded or set()
 
+    # Each location's expenses are totalled once and shared by the
+    # living-wage adjustment and the engel split below
+    housing_a, non_housing_a, excluded_a = _split_expenses(loc_a, family, excluded)
+    housing_b, non_housing_b, excluded_b = _split_expenses(loc_b, family, excluded)
+
     # Adjust living-wage anchors by removing excluded category expenses
-    adj_a = _adjust_living_wage(lw_before_tax_a, loc_a, family, excluded)
-    adj_b = _adjust_living_wage(lw_before_tax_b, loc_b, family, excluded)
+    adj_a = lw_before_tax_a - excluded_a
+    adj_b = lw_before_tax_b - excluded_b
 
     if adj_a <= 0 or adj_b <= 0:
         return income_a
@@ -507,50 +846,10 @@ def compute_equivalent_income(
                 method="sqrt", excluded=excluded,
             )
 
-        # Compute housing and non-housing expense totals for each location
-        housing_excluded = "Housing" in excluded
-        housing_a = (
-            0.0 if housing_excluded
-            else loc_a.get("expenses", {}).get("Housing", {}).get(family, 0.0)
+        return _engel_equivalent(
+            income_a, adj_a, ratio,
+            housing_a, housing_b, non_housing_a, non_housing_b,
         )
-        housing_b = (
-            0.0 if housing_excluded
-            else loc_b.get("expenses", {}).get("Housing", {}).get(family, 0.0)
-        )
-
-        non_housing_a = 0.0
-        non_housing_b = 0.0
-        for cat in EXPENSE_CATEGORIES:
-            if cat == "Housing" or cat in excluded:
-                continue
-            non_housing_a += loc_a.get("expenses", {}).get(cat, {}).get(family, 0.0)
-            non_housing_b += loc_b.get("expenses", {}).get(cat, {}).get(family, 0.0)
-
-        # Compute per-category ratios (guard against zero)
-        housing_ratio = (housing_b / housing_a) if housing_a > 0 else ratio
-        non_housing_ratio = (
-            (non_housing_b / non_housing_a) if non_housing_a > 0 else ratio
-        )
-
-        # Housing share at the living wage level
-        total_expenses_a = housing_a + non_housing_a
-        housing_share_at_lw = (
-            (housing_a / total_expenses_a) if total_expenses_a > 0 else 0.3
-        )
-
-        # Engel curve: housing share decreases with income
-        if adj_a > 0 and income_a > 0:
-            housing_share = housing_share_at_lw * (
-                (adj_a / income_a) ** 0.3
-            )
-        else:
-            housing_share = housing_share_at_lw
-
-        effective_ratio = (
-            housing_share * housing_ratio
-            + (1 - housing_share) * non_housing_ratio
-        )
-        return income_a * effective_ratio
 
     else:
         # Unknown method, fall back to sqrt
@@ -607,14 +906,16 @@ def print_comparison(
     family_label = FAMILY_LABELS.get(family, family)
     names = [loc["name"] for loc in locations]
 
-    print()
-    print("Cost of Living Comparison")
-    print("=" * 60)
-    print("  vs  ".join(names))
-    print(f"Family type: {family_label}")
+    # Build the whole report and emit it with one write
+    out: list[str] = []
+    out.append("")
+    out.append("Cost of Living Comparison")
+    out.append("=" * 60)
+    out.append("  vs  ".join(names))
+    out.append(f"Family type: {family_label}")
     if excluded:
-        print(f"Excluded:    {', '.join(sorted(excluded))}")
-    print()
+        out.append(f"Excluded:    {', '.join(sorted(excluded))}")
+    out.append("")
 
     # --- Headline income equivalence ---
     if income is not None and len(locations) >= 2:
@@ -622,8 +923,10 @@ def print_comparison(
         ref_bt = ref["income_before_tax"].get(family)
         if ref_bt:
             method_label = METHOD_LABELS.get(method, method)
-            print(f"INCOME EQUIVALENCE  [method: {method_label}]")
-            print("-" * 60)
+            out.append(f"INCOME EQUIVALENCE  [method: {method_label}]")
+            out.append("-" * 60)
+            income_str = format_dollar(income)
+            ref_name = ref["name"]
             for loc in locations[1:]:
                 loc_bt = loc["income_before_tax"].get(family)
                 if loc_bt:
@@ -636,13 +939,17 @@ def print_comparison(
                         excluded=excluded,
                     )
                     diff_pct = pct_diff(income, equiv)
-                    direction = "less" if diff_pct and diff_pct < 0 else "more"
-                    pct_str = f" ({abs(diff_pct):.1f}% {direction})" if diff_pct else ""
-                    print(
-                        f"  {format_dollar(income)} in {ref['name']}"
+                    # No percentage for an unchanged (or undefined) difference
+                    pct_str = (
+                        f" ({abs(diff_pct):.1f}% {'less' if diff_pct < 0 else 'more'})"
+                        if diff_pct
+                        else ""
+                    )
+                    out.append(
+                        f"  {income_str} in {ref_name}"
                         f"  ~  {format_dollar(equiv)} in {loc['name']}{pct_str}"
                     )
-            print()
+            out.append("")
 
     # --- Expense breakdown ---
     # Column widths
@@ -650,84 +957,86 @@ def print_comparison(
     val_width = max(14, max(len(n) for n in names) + 2)
 
     # Header
-    header = f"{'Category':<{cat_width}}"
-    for name in names:
-        header += f"{name:>{val_width}}"
+    header_cells = [f"{'Category':<{cat_width}}"]
+    header_cells.extend(f"{name:>{val_width}}" for name in names)
     if len(locations) >= 2:
-        header += f"{'Diff':>10}"
-    print("Expense Breakdown (Annual):")
-    print(header)
-    print("\u2500" * len(header))
+        header_cells.append(f"{'Diff':>10}")
+    header = "".join(header_cells)
+    out.append("Expense Breakdown (Annual):")
+    out.append(header)
+    out.append("\u2500" * len(header))
 
     total_by_loc: list[float] = [0.0] * len(locations)
 
+    # Pull each location's values for this family once, so the row loops
+    # below index flat dicts instead of walking category -> family dicts
+    family_expenses = [
+        {cat: by_family.get(family) for cat, by_family in loc["expenses"].items()}
+        for loc in locations
+    ]
+    tax_vals: list[Optional[float]] = [loc["taxes"].get(family) for loc in locations]
+
     for cat in active_categories:
-        row = f"{cat:<{cat_width}}"
-        vals: list[Optional[float]] = []
-        for loc in locations:
-            v = loc["expenses"].get(cat, {}).get(family)
-            vals.append(v)
+        cells: list[str] = [f"{cat:<{cat_width}}"]
+        vals: list[Optional[float]] = [e.get(cat) for e in family_expenses]
         for i, v in enumerate(vals):
             if v is not None:
-                row += f"{format_dollar(v):>{val_width}}"
+                cells.append(f"{format_dollar(v):>{val_width}}")
                 total_by_loc[i] += v
             else:
-                row += f"{'N/A':>{val_width}}"
+                cells.append(f"{'N/A':>{val_width}}")
         if len(locations) >= 2 and vals[0] is not None and vals[1] is not None:
             pd = pct_diff(vals[0], vals[1])
-            row += f"{format_pct(pd) if pd is not None else 'N/A':>10}"
-        print(row)
+            cells.append(f"{format_pct(pd) if pd is not None else 'N/A':>10}")
+        out.append("".join(cells))
 
     # Taxes row
-    row = f"{'Taxes':<{cat_width}}"
-    tax_vals: list[Optional[float]] = []
-    for loc in locations:
-        v = loc["taxes"].get(family)
-        tax_vals.append(v)
+    cells = [f"{'Taxes':<{cat_width}}"]
     for i, v in enumerate(tax_vals):
         if v is not None:
-            row += f"{format_dollar(v):>{val_width}}"
+            cells.append(f"{format_dollar(v):>{val_width}}")
             total_by_loc[i] += v
         else:
-            row += f"{'N/A':>{val_width}}"
+            cells.append(f"{'N/A':>{val_width}}")
     if len(locations) >= 2 and tax_vals[0] is not None and tax_vals[1] is not None:
         pd = pct_diff(tax_vals[0], tax_vals[1])
-        row += f"{format_pct(pd) if pd is not None else 'N/A':>10}"
-    print(row)
+        cells.append(f"{format_pct(pd) if pd is not None else 'N/A':>10}")
+    out.append("".join(cells))
 
-    print("\u2500" * len(header))
+    out.append("\u2500" * len(header))
 
     # Total row — use the running total which only includes active categories + taxes
     label = "Total (pre-tax)" if not excluded else "Total (adjusted)"
-    row = f"{label:<{cat_width}}"
+    cells = [f"{label:<{cat_width}}"]
     for i, t in enumerate(total_by_loc):
-        row += f"{format_dollar(t):>{val_width}}"
+        cells.append(f"{format_dollar(t):>{val_width}}")
     if len(locations) >= 2 and total_by_loc[0] > 0 and total_by_loc[1] > 0:
         pd = pct_diff(total_by_loc[0], total_by_loc[1])
-        row += f"{format_pct(pd) if pd is not None else 'N/A':>10}"
-    print(row)
+        cells.append(f"{format_pct(pd) if pd is not None else 'N/A':>10}")
+    out.append("".join(cells))
 
-    print()
+    out.append("")
 
     # Living wage — recalculate from running total when categories are excluded
     label = "Living Wage" if not excluded else "Adj. Living Wage"
-    row = f"{label:<{cat_width}}"
+    cells = [f"{label:<{cat_width}}"]
     if excluded:
         for t in total_by_loc:
             hourly = t / 2080 if t > 0 else 0.0
-            row += f"{'${:.2f}/hr'.format(hourly):>{val_width}}"
+            cells.append(f"{'${:.2f}/hr'.format(hourly):>{val_width}}")
     else:
         for loc in locations:
             w = loc["wages"].get(family)
             if w is not None:
-                row += f"{'${:.2f}/hr'.format(w):>{val_width}}"
+                cells.append(f"{'${:.2f}/hr'.format(w):>{val_width}}")
             else:
-                row += f"{'N/A':>{val_width}}"
-    print(row)
+                cells.append(f"{'N/A':>{val_width}}")
+    out.append("".join(cells))
 
-    print()
-    print("Data source: MIT Living Wage Calculator (https://livingwage.mit.edu)")
-    print()
+    out.append("")
+    out.append("Data source: MIT Living Wage Calculator (https://livingwage.mit.edu)")
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def print_single_location(
@@ -740,13 +1049,14 @@ def print_single_location(
     active_categories = [c for c in EXPENSE_CATEGORIES if c not in excluded]
 
     family_label = FAMILY_LABELS.get(family, family)
-    print()
-    print(f"Living Wage Data: {loc['name']}")
-    print("=" * 50)
-    print(f"Family type: {family_label}")
+    out: list[str] = []
+    out.append("")
+    out.append(f"Living Wage Data: {loc['name']}")
+    out.append("=" * 50)
+    out.append(f"Family type: {family_label}")
     if excluded:
-        print(f"Excluded:    {', '.join(sorted(excluded))}")
-    print()
+        out.append(f"Excluded:    {', '.join(sorted(excluded))}")
+    out.append("")
 
     # Compute running total of active categories + taxes for adjusted figures
     running_total = 0.0
@@ -760,61 +1070,68 @@ def print_single_location(
 
     if excluded:
         adj_hourly = running_total / 2080 if running_total > 0 else 0.0
-        print(f"  Adj. Living Wage: ${adj_hourly:.2f}/hr")
-        print(f"  Adjusted Annual Income (before tax): {format_dollar(running_total)}")
+        out.append(f"  Adj. Living Wage: ${adj_hourly:.2f}/hr")
+        out.append(f"  Adjusted Annual Income (before tax): {format_dollar(running_total)}")
     else:
         wage = loc["wages"].get(family)
         if wage is not None:
-            print(f"  Living Wage: ${wage:.2f}/hr")
+            out.append(f"  Living Wage: ${wage:.2f}/hr")
         bt = loc["income_before_tax"].get(family)
         if bt is not None:
-            print(f"  Required Annual Income (before tax): {format_dollar(bt)}")
+            out.append(f"  Required Annual Income (before tax): {format_dollar(bt)}")
 
     at = loc["income_after_tax"].get(family)
     if at is not None and not excluded:
-        print(f"  Required Annual Income (after tax):  {format_dollar(at)}")
+        out.append(f"  Required Annual Income (after tax):  {format_dollar(at)}")
 
-    print()
-    print("  Annual Expenses:")
+    out.append("")
+    out.append("  Annual Expenses:")
     for cat in active_categories:
         v = loc["expenses"].get(cat, {}).get(family)
         if v is not None:
-            print(f"    {cat:<22} {format_dollar(v)}")
+            out.append(f"    {cat:<22} {format_dollar(v)}")
 
     if tax is not None:
-        print(f"    {'Taxes':<22} {format_dollar(tax)}")
+        out.append(f"    {'Taxes':<22} {format_dollar(tax)}")
 
-    print()
-    print("Data source: MIT Living Wage Calculator (https://livingwage.mit.edu)")
-    print()
+    out.append("")
+    out.append("Data source: MIT Living Wage Calculator (https://livingwage.mit.edu)")
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def list_locations() -> None:
     """Print all known locations."""
-    print("\nMetro Areas (use with --metros <code>):")
-    print("-" * 60)
+    out: list[str] = []
+    out.append("\nMetro Areas (use with --metros <code>):")
+    out.append("-" * 60)
     for code, name in sorted(METROS.items(), key=lambda x: x[1]):
-        print(f"  {code}  {name}")
+        out.append(f"  {code}  {name}")
 
-    print(f"\nCounties (use with --counties <code>):")
-    print("-" * 60)
+    out.append(f"\nCounties (use with --counties <code>):")
+    out.append("-" * 60)
     for code, name in sorted(COUNTIES.items(), key=lambda x: x[1]):
-        print(f"  {code}  {name}")
+        out.append(f"  {code}  {name}")
 
-    print(f"\nStates (use with --states <code>):")
-    print("-" * 60)
+    out.append(f"\nStates (use with --states <code>):")
+    out.append("-" * 60)
     for code, name in sorted(STATES.items(), key=lambda x: x[1]):
-        print(f"  {code}  {name}")
-    print()
-    print("Any county or metro can also be used by FIPS/CBSA code directly,")
-    print("even if not listed above. Find codes at https://livingwage.mit.edu")
-    print()
+        out.append(f"  {code}  {name}")
+    out.append("")
+    out.append("Any county or metro can also be used by FIPS/CBSA code directly,")
+    out.append("even if not listed above. Find codes at https://livingwage.mit.edu")
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
 
+# Direct-code CLI options and the location type each one selects
+CODE_ARGS = (("metros", "metro"), ("counties", "county"), ("states", "state"))
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Compare cost of living between US locations using MIT Living Wage data.",
@@ -879,12 +1196,16 @@ Examples:
         help=(
             "Exclude one or more expense categories from the comparison. "
             "Available categories: "
-            + ", ".join(EXPENSE_CATEGORIES)
+            + _CATEGORY_NAMES
         ))
     parser.add_argument (
         "--database", default=DEFAULT_DB_PATH, metavar="PATH",
         help="Path to location database JSON file (default: database/locations_v1.json)",
     )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Ignore the on-disk cache and fetch fresh pages from MIT, refreshing the cache",
+    )
 
     return parser
 
@@ -894,13 +1215,12 @@ def resolve_excluded_categories(raw: list[str]) -> set[str]:
 
     Matching is case-insensitive. Exits with an error for unrecognized names.
     """
-    lookup = {cat.lower(): cat for cat in EXPENSE_CATEGORIES}
     resolved: set[str] = set()
     for name in raw:
-        canon = lookup.get(name.lower())
+        canon = _CATEGORY_LOOKUP.get(name.casefold())
         if canon is None:
             print(f"Error: Unknown expense category '{name}'.")
-            print(f"Available categories: {', '.join(EXPENSE_CATEGORIES)}")
+            print(f"Available categories: {_CATEGORY_NAMES}")
             sys.exit(1)
         resolved.add(canon)
     return resolved
@@ -910,9 +1230,10 @@ def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
-    load_database(args.database)
-
+    # Only name search and --list need the location database; direct
+    # code lookups go straight to the MIT URL
     if args.list:
+        load_database(args.database)
         list_locations()
         return
 
@@ -920,46 +1241,39 @@ def main() -> None:
     loc_specs: list[tuple[str, str]] = []  # (type, code)
 
     if args.search:
-        for term in args.search:
-            typ, code, name = resolve_search_term(term)
-            loc_specs.append((typ, code))
-    elif args.metros:
-        for code in args.metros:
-            loc_specs.append(("metro", code))
-    elif args.counties:
-        for code in args.counties:
-            loc_specs.append(("county", code))
-    elif args.states:
-        for code in args.states:
-            loc_specs.append(("state", code))
+        load_database(args.database)
+        loc_specs = [resolve_search_term(term)[:2] for term in args.search]
     else:
-        parser.print_help()
-        return
+        for attr, loc_type in CODE_ARGS:
+            codes = getattr(args, attr)
+            if codes:
+                loc_specs = [(loc_type, code) for code in codes]
+                break
+        else:
+            parser.print_help()
+            return
 
     if not loc_specs:
         print("Error: No locations specified.")
         sys.exit(1)
 
-    # Fetch data for each location
-    location_data: list[dict] = []
-    for loc_type, code in loc_specs:
-        url = location_url(loc_type, code)
-        print(f"Fetching data from {url} ...", file=sys.stderr)
-        try:
-            soup = fetch_page(url)
-            data = parse_location_data(soup)
-            data["url"] = url
-            location_data.append(data)
-        except requests.HTTPError as e:
-            print(f"Error fetching {url}: {e}", file=sys.stderr)
-            sys.exit(1)
-        except requests.ConnectionError as e:
-            print(f"Connection error for {url}: {e}", file=sys.stderr)
-            sys.exit(1)
+    # Validate --exclude before paying for any network round-trips
+    excluded = resolve_excluded_categories(args.exclude) if args.exclude else set()
+
+    # Fetch data for all locations concurrently
+    import requests
+
+    try:
+        location_data = fetch_locations(loc_specs, use_cache=not args.no_cache)
+    except FetchError as e:
+        if isinstance(e.error, requests.ConnectionError):
+            print(f"Connection error for {e.url}: {e.error}", file=sys.stderr)
+        else:
+            print(f"Error fetching {e.url}: {e.error}", file=sys.stderr)
+        sys.exit(1)
 
     # Display
     family = args.family
-    excluded = resolve_excluded_categories(args.exclude) if args.exclude else set()
     if len(location_data) == 1:
         print_single_location(location_data[0], family, excluded=excluded)
     else: